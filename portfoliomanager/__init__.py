@@ -5,12 +5,22 @@ LangGraph-based autonomous portfolio management system.
 Uses graph architecture with MCP tools for trading operations.
 """
 
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
 from .config import PORTFOLIO_CONFIG
-from .graph_v2 import (
-    create_portfolio_graph,
-    run_portfolio_iteration,
-    PortfolioState,
-)
+
+if TYPE_CHECKING:
+    from .graph_v2 import create_portfolio_graph, run_portfolio_iteration, PortfolioState
+
+# The graph pulls in LangGraph, LangChain, the Alpaca SDK and boto3.
+# Resolve these names on first access so importing the package - e.g. for
+# `portfoliomanager --help` - doesn't load all of that.
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    'create_portfolio_graph': '.graph_v2',
+    'run_portfolio_iteration': '.graph_v2',
+    'PortfolioState': '.graph_v2',
+})
 
 __all__ = [
     'PORTFOLIO_CONFIG',
@@ -0,0 +1,40 @@
+"""
+Lazy Package Exports
+
+Helper for package __init__ modules that re-export names from the graph
+stack (LangGraph, LangChain, the Alpaca SDK, boto3). The defining
+submodule is imported on first attribute access (PEP 562) instead of when
+the package is imported.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    namespace: Dict[str, Any],
+    attrs: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        namespace: The package's globals(); resolved names are cached there
+        attrs: Exported name -> relative module that defines it
+
+    Returns:
+        (__getattr__, __dir__) to assign at the package's top level
+    """
+    def __getattr__(name: str) -> Any:
+        if name in attrs:
+            value = getattr(import_module(attrs[name], package), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attrs))
+
+    return __getattr__, __dir__
@@ -1,6 +1,5 @@
 """Portfolio management data flows"""
 
-from .s3_client import S3ReportManager
-
-__all__ = ['S3ReportManager']
+from .s3_client import S3ReportManager, get_s3_report_manager
 
+__all__ = ['S3ReportManager', 'get_s3_report_manager']
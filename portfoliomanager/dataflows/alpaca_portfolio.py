@@ -6,6 +6,7 @@ Returns raw position data - agent uses stock tools to analyze further.
 """
 
 from typing import Dict, List, Any, Optional
+from functools import lru_cache
 import os
 import logging
 from alpaca.trading.client import TradingClient
@@ -22,9 +23,21 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Clients hold a requests session (connection pool), so one client per set of
+# credentials is reused instead of paying a new TLS handshake on every call
+@lru_cache(maxsize=4)
+def _cached_trading_client(api_key: str, api_secret: str, paper: bool) -> TradingClient:
+    """Trading client for a set of credentials, created once"""
+    return TradingClient(api_key, api_secret, paper=paper)
+
+@lru_cache(maxsize=4)
+def _cached_data_client(api_key: str, api_secret: str) -> StockHistoricalDataClient:
+    """Market data client for a set of credentials, created once"""
+    return StockHistoricalDataClient(api_key, api_secret)
+
 # Initialize Alpaca client
 def _get_trading_client() -> TradingClient:
-    """Get initialized Alpaca trading client"""
+    """Get initialized Alpaca trading client (shared per credentials)"""
     api_key = os.getenv("ALPACA_API_KEY")
     # Support both ALPACA_API_SECRET and ALPACA_SECRET_KEY
     api_secret = os.getenv("ALPACA_API_SECRET") or os.getenv("ALPACA_SECRET_KEY")
@@ -37,10 +50,10 @@ def _get_trading_client() -> TradingClient:
             f"API_SECRET={'set' if api_secret else 'NOT SET'}"
         )
     
-    return TradingClient(api_key, api_secret, paper=paper)
+    return _cached_trading_client(api_key, api_secret, paper)
 
 def _get_data_client() -> StockHistoricalDataClient:
-    """Get initialized Alpaca data client"""
+    """Get initialized Alpaca data client (shared per credentials)"""
     api_key = os.getenv("ALPACA_API_KEY")
     api_secret = os.getenv("ALPACA_API_SECRET") or os.getenv("ALPACA_SECRET_KEY")
     
@@ -49,7 +62,7 @@ def _get_data_client() -> StockHistoricalDataClient:
             "ALPACA_API_KEY and ALPACA_API_SECRET must be set in environment"
         )
     
-    return StockHistoricalDataClient(api_key, api_secret)
+    return _cached_data_client(api_key, api_secret)
 
 def get_account() -> Dict[str, Any]:
     """Get account information from Alpaca"""
@@ -7,15 +7,25 @@ Handles all S3 operations for storing and retrieving reports, logs, and summarie
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, List
 from datetime import datetime
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Connection pool size for the shared client - uploads run on several threads
+MAX_POOL_CONNECTIONS = 16
+
+# One long-lived pool for the paired summary uploads, so save_summary()
+# doesn't start and join new threads on every iteration
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="s3-upload")
+
 
 class S3ReportManager:
     """Manages report storage and retrieval in S3"""
@@ -36,12 +46,14 @@ class S3ReportManager:
         aws_secret = os.getenv('AWS_SECRET_ACCESS_KEY')
     
         
-        # Initialize boto3 client
+        # Initialize boto3 client (thread-safe - one client and its
+        # connection pool are shared by concurrent uploads)
         self.s3_client = boto3.client(
             's3',
             region_name=region,
             aws_access_key_id=aws_key,
-            aws_secret_access_key=aws_secret
+            aws_secret_access_key=aws_secret,
+            config=Config(max_pool_connections=MAX_POOL_CONNECTIONS)
         )
         
         logger.info(f"S3 client initialized for bucket '{bucket_name}' in region '{region}'")
@@ -148,21 +160,21 @@ class S3ReportManager:
             True if successful, False otherwise
         """
         try:
-            # Save with iteration ID
-            s3_key = f"summaries/{iteration_id}.txt"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=summary.encode('utf-8')
-            )
-            
-            # Also save as latest
-            latest_key = "summaries/latest.txt"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=latest_key,
-                Body=summary.encode('utf-8')
-            )
+            # Save with iteration ID and as latest - the two writes are
+            # independent, so they are uploaded concurrently
+            body = summary.encode('utf-8')
+            s3_keys = (f"summaries/{iteration_id}.txt", "summaries/latest.txt")
+            futures = [
+                _UPLOAD_EXECUTOR.submit(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=body
+                )
+                for s3_key in s3_keys
+            ]
+            for future in futures:
+                future.result()
             
             logger.info(f"Saved summary for iteration {iteration_id} to S3")
             return True
@@ -170,3 +182,23 @@ class S3ReportManager:
         except Exception as e:
             logger.error(f"Error saving summary: {e}")
             return False
+
+
+@lru_cache(maxsize=8)
+def get_s3_report_manager(bucket_name: str, region: str = 'us-east-1') -> S3ReportManager:
+    """
+    Get a shared S3ReportManager for a bucket.
+    
+    Constructing a manager builds a boto3 client and checks the bucket with a
+    head_bucket round trip. Neither changes between iterations, so one
+    manager per (bucket, region) is created and reused for the life of the
+    process. Construction errors are not cached.
+    
+    Args:
+        bucket_name: Name of the S3 bucket
+        region: AWS region
+        
+    Returns:
+        S3ReportManager for the bucket
+    """
+    return S3ReportManager(bucket_name, region)
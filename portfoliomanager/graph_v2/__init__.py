@@ -8,8 +8,23 @@ Modern implementation using:
 - Fully automated trading with no human approval required
 """
 
-from .state import PortfolioState, TradeDecision, AnalysisResult
-from .portfolio_graph import create_portfolio_graph, run_portfolio_iteration
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .state import PortfolioState, TradeDecision, AnalysisResult
+    from .portfolio_graph import create_portfolio_graph, run_portfolio_iteration
+
+# Imported on first access so that loading one submodule (e.g.
+# stock_prompt_template) doesn't build the whole graph stack
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "PortfolioState": ".state",
+    "TradeDecision": ".state",
+    "AnalysisResult": ".state",
+    "create_portfolio_graph": ".portfolio_graph",
+    "run_portfolio_iteration": ".portfolio_graph",
+})
 
 __all__ = [
     "PortfolioState",
@@ -18,4 +33,3 @@ __all__ = [
     "create_portfolio_graph",
     "run_portfolio_iteration"
 ]
-
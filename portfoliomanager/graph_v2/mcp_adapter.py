@@ -7,15 +7,13 @@ Replaces all custom trading, account, and market data tools.
 
 import os
 from typing import List
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool
 import asyncio
 
 
 async def _init_alpaca_toolkit_async():
     """Internal async function to initialize Alpaca MCP toolkit"""
     from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_core.tools import StructuredTool
-    import asyncio
     
     # Validate environment variables
     api_key = os.getenv("ALPACA_API_KEY")
@@ -67,12 +65,16 @@ async def _init_alpaca_toolkit_async():
                     asyncio.set_event_loop(loop)
                 return loop.run_until_complete(async_tool.ainvoke(kwargs))
             
+            async def async_func(**kwargs):
+                """Async entry point - StructuredTool passes args as kwargs"""
+                return await async_tool.ainvoke(kwargs)
+            
             return StructuredTool(
                 name=async_tool.name,
                 description=async_tool.description,
                 func=sync_func,
                 args_schema=async_tool.args_schema,
-                coroutine=async_tool.ainvoke  # Keep async version too
+                coroutine=async_func  # Keep async version too
             )
         
         sync_tools.append(make_sync_wrapper(tool))
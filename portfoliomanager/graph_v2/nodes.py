@@ -13,20 +13,36 @@ Nodes are:
 - Automatically checkpointed by LangGraph
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any
+import re
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, cast
 from datetime import datetime
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage, message_chunk_to_message
 
 from .state import PortfolioState
 from .mcp_adapter import get_alpaca_mcp_tools
-from .safe_trading_tools import get_safe_trading_tools
-from shared.llm_factory import get_agent_llm
-from portfoliomanager.dataflows.s3_client import S3ReportManager
+from .safe_trading_tools import ALLOWED_TOOL_NAMES, get_safe_trading_tools
+from .stock_prompt_template import EXIT_STRATEGY_GUIDANCE, generate_stock_portfolio_prompt
+from shared.llm_factory import get_agent_llm, get_quick_llm
+from portfoliomanager.dataflows.alpaca_portfolio import (
+    get_alpaca_account_info,
+    get_alpaca_positions,
+    get_alpaca_open_orders,
+    get_alpaca_market_clock
+)
+from portfoliomanager.dataflows.s3_client import get_s3_report_manager
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# "Run #N" counter in the memory summary header
+_RUN_COUNT_RE = re.compile(r'Run #(\d+)')
+
 
 def get_model_tag(llm) -> str:
     """
@@ -105,13 +121,6 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
         # Check if market is open BEFORE fetching any portfolio data
         # This saves time and API calls if market is closed
         
-        from portfoliomanager.dataflows.alpaca_portfolio import (
-            get_alpaca_account_info,
-            get_alpaca_positions,
-            get_alpaca_open_orders,
-            get_alpaca_market_clock
-        )
-        
         logger.info("[SYSTEM] 🕐 [STEP 1/4] Checking market status...")
         market_clock = {}
         try:
@@ -148,7 +157,9 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
                 "last_summary": ""
             }
         
-        # ==================== STEP 2: FETCH LAST SUMMARY FROM S3 ====================
+        # ==================== STEP 2: FETCH LAST SUMMARY + PORTFOLIO DATA ====================
+        # The remaining fetches are a fixed, independent set, so they are all
+        # dispatched at once and their results consumed (and logged) in order
         
         config = state.get("config", {})
         s3_bucket = config.get("s3_bucket_name")
@@ -160,52 +171,63 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
             logger.error("[SYSTEM] ❌ S3 bucket not configured! S3 operations are REQUIRED.")
             raise ValueError("S3_BUCKET_NAME must be configured in environment variables")
         
-        try:
-            logger.info("[SYSTEM] 📜 [STEP 2/4] Fetching last iteration summary from S3...")
-            s3_manager = S3ReportManager(s3_bucket, s3_region)
-            last_summary = s3_manager.get_last_summary() or ""
+        def fetch_last_summary() -> str:
+            return get_s3_report_manager(s3_bucket, s3_region).get_last_summary() or ""
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            summary_future = executor.submit(fetch_last_summary)
+            account_future = executor.submit(get_alpaca_account_info)
+            positions_future = executor.submit(get_alpaca_positions)
+            orders_future = executor.submit(get_alpaca_open_orders)
             
-            if last_summary:
-                logger.info("[SYSTEM] " + "=" * 70)
-                logger.info("[SYSTEM] 📜 LAST ITERATION SUMMARY")
-                logger.info("[SYSTEM] " + "=" * 70)
-                logger.info("[SYSTEM] " + last_summary)
-                logger.info("[SYSTEM] " + "=" * 70)
-            else:
-                logger.info("[SYSTEM] ℹ️  No previous summary found (first run)")
-        except Exception as e:
-            logger.warning(f"[SYSTEM] Could not fetch last summary from S3: {e}")
-        
-        # ==================== STEP 3: FETCH PORTFOLIO DATA ====================
-        
-        logger.info("[SYSTEM] 📊 [STEP 3/4] Fetching portfolio data from Alpaca...")
-        
-        # Get account information
-        logger.info("[SYSTEM]   💰 Fetching account info...")
-        account_info = get_alpaca_account_info()
-        logger.info(f"[SYSTEM]      Cash: ${account_info.get('cash', 0):,.2f}")
-        logger.info(f"[SYSTEM]      Portfolio Value: ${account_info.get('portfolio_value', 0):,.2f}")
-        logger.info(f"[SYSTEM]      Buying Power: ${account_info.get('buying_power', 0):,.2f}")
-        
-        # Get current positions
-        logger.info("[SYSTEM]   📈 Fetching positions...")
-        positions = get_alpaca_positions()
-        logger.info(f"[SYSTEM]      Found {len(positions)} positions")
-        for pos in positions:
-            logger.info(f"[SYSTEM]        {pos['ticker']}: {pos['qty']} shares @ ${pos['current_price']:.2f}, "
-                       f"P&L: {pos['unrealized_pl_pct']:+.1f}%")
-        
-        # Get open orders
-        logger.info("[SYSTEM]   📋 Fetching open orders...")
-        open_orders = get_alpaca_open_orders()
-        logger.info(f"[SYSTEM]      Found {len(open_orders)} open orders")
-        for order in open_orders:
-            logger.info(f"[SYSTEM]        {order['side']} {order['ticker']}: {order['qty']} shares ({order['status']})")
+            try:
+                logger.info("[SYSTEM] 📜 [STEP 2/4] Fetching last iteration summary from S3...")
+                last_summary = summary_future.result()
+                
+                if last_summary:
+                    logger.info("[SYSTEM] " + "=" * 70)
+                    logger.info("[SYSTEM] 📜 LAST ITERATION SUMMARY")
+                    logger.info("[SYSTEM] " + "=" * 70)
+                    logger.info("[SYSTEM] " + last_summary)
+                    logger.info("[SYSTEM] " + "=" * 70)
+                else:
+                    logger.info("[SYSTEM] ℹ️  No previous summary found (first run)")
+            except Exception as e:
+                logger.warning(f"[SYSTEM] Could not fetch last summary from S3: {e}")
+            
+            # ==================== STEP 3: FETCH PORTFOLIO DATA ====================
+            
+            logger.info("[SYSTEM] 📊 [STEP 3/4] Fetching portfolio data from Alpaca...")
+            
+            # Get account information
+            logger.info("[SYSTEM]   💰 Fetching account info...")
+            account_info = account_future.result()
+            logger.info(f"[SYSTEM]      Cash: ${account_info.get('cash', 0):,.2f}")
+            logger.info(f"[SYSTEM]      Portfolio Value: ${account_info.get('portfolio_value', 0):,.2f}")
+            logger.info(f"[SYSTEM]      Buying Power: ${account_info.get('buying_power', 0):,.2f}")
+            
+            # Get current positions
+            logger.info("[SYSTEM]   📈 Fetching positions...")
+            positions = positions_future.result()
+            logger.info(f"[SYSTEM]      Found {len(positions)} positions")
+            # Per-item lines are only formatted when INFO is enabled
+            info_on = logger.isEnabledFor(logging.INFO)
+            if info_on:
+                for pos in positions:
+                    logger.info(f"[SYSTEM]        {pos['ticker']}: {pos['qty']} shares @ ${pos['current_price']:.2f}, "
+                               f"P&L: {pos['unrealized_pl_pct']:+.1f}%")
+            
+            # Get open orders
+            logger.info("[SYSTEM]   📋 Fetching open orders...")
+            open_orders = orders_future.result()
+            logger.info(f"[SYSTEM]      Found {len(open_orders)} open orders")
+            if info_on:
+                for order in open_orders:
+                    logger.info(f"[SYSTEM]        {order['side']} {order['ticker']}: {order['qty']} shares ({order['status']})")
         
         # Format positions for state (convert to format expected by downstream nodes)
-        formatted_positions = []
-        for pos in positions:
-            formatted_positions.append({
+        formatted_positions = [
+            {
                 'symbol': pos['ticker'],
                 'qty': pos['qty'],
                 'market_value': pos['market_value'],
@@ -213,7 +235,9 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
                 'current_price': pos['current_price'],
                 'unrealized_plpc': pos['unrealized_pl_pct'] / 100,  # Convert back to decimal
                 'unrealized_pl': pos['unrealized_pl']
-            })
+            }
+            for pos in positions
+        ]
         
         logger.info("[SYSTEM] ✅ [STEP 4/4] Portfolio data fetched successfully")
         
@@ -226,7 +250,6 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
             "market_clock": market_clock
         }
     except Exception as e:
-        import traceback
         traceback.print_exc()
         logger.error(f"[SYSTEM] ❌ Error assessing portfolio: {e}", exc_info=True)
         return {
@@ -237,6 +260,291 @@ def assess_portfolio_node(state: PortfolioState) -> Dict[str, Any]:
 
 # ==================== Trading Decisions ====================
 
+@lru_cache(maxsize=1)
+def _get_safe_tools() -> Tuple[List[Any], Dict[str, Any], str]:
+    """
+    Load the safe trading tools once per process.
+    
+    Listing the MCP tools starts the Alpaca MCP server and builds a pydantic
+    schema per tool; the set never changes while the process runs. Errors
+    aren't cached, so a failed load is retried on the next iteration.
+    
+    Returns:
+        (safe tools, tools keyed by name, tool list text for the prompt)
+    """
+    safe_tools = get_safe_trading_tools(get_alpaca_mcp_tools())
+    tools_by_name = {tool.name: tool for tool in safe_tools}
+    tools_text = "\n".join(f"  - {tool.name}: {tool.description}" for tool in safe_tools)
+    return safe_tools, tools_by_name, tools_text
+
+
+# Outcome recorded for a tool call whose tool isn't in the bound tool list
+_TOOL_NOT_FOUND = object()
+
+# Read-only tools describing account state, which only changes when an order
+# is placed - repeat calls within one decision run are served from memory
+_ACCOUNT_STATE_TOOL_NAMES = frozenset({
+    "get_account",
+    "get_positions",
+    "get_open_orders",
+    "get_market_clock",
+})
+
+# Upper bound on read-only tool calls started while a response is streaming
+_MAX_EARLY_TOOL_CALLS = 8
+
+# One long-lived pool for those early calls. MCP tools run their sync wrapper
+# on the worker thread, which sets up an event loop the first time; keeping
+# the workers alive lets every later turn reuse those loops instead of
+# leaving a new one behind per worker per turn.
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_EARLY_TOOL_CALLS,
+    thread_name_prefix="tool-prefetch"
+)
+
+# Tool results from the most recent agent turns are resent in full; older
+# ones are cut to a preview to bound the tokens sent on every LLM call
+_FULL_RESULT_TURNS = 2
+_STALE_RESULT_PREVIEW = 300
+
+
+def _invoke_tool(tool, tool_args: Dict[str, Any]) -> Any:
+    """Invoke a tool synchronously, returning the raised exception instead of propagating it"""
+    try:
+        return tool.invoke(tool_args)
+    except Exception as e:
+        return e
+
+
+def _gather_tool_calls(calls: List[Tuple[int, Any, Dict[str, Any]]]) -> List[Any]:
+    """
+    Run independent tool calls concurrently with asyncio.gather.
+    
+    Args:
+        calls: (index, tool, args) for each call
+        
+    Returns:
+        Result or raised exception for each call, in call order
+    """
+    if len(calls) == 1:
+        _, tool, tool_args = calls[0]
+        return [_invoke_tool(tool, tool_args)]
+    
+    async def _gather():
+        return await asyncio.gather(
+            *(tool.ainvoke(tool_args) for _, tool, tool_args in calls),
+            return_exceptions=True
+        )
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_gather())
+    
+    # Already inside an event loop on this thread - can't nest, run serially
+    return [_invoke_tool(tool, tool_args) for _, tool, tool_args in calls]
+
+
+def _compact_tool_results(messages: List[Any], turns_in_full: int, start: int = 0) -> int:
+    """
+    Shorten tool results outside the last `turns_in_full` agent turns, in place.
+    
+    Messages are never dropped: every tool_calls message keeps its ToolMessage
+    replies (the API rejects unpaired ones) and earlier results such as order
+    confirmations stay visible as a preview.
+    
+    Only messages from `start` on are visited, so passing back the returned
+    index each turn compacts every message once instead of rescanning the
+    whole conversation.
+    
+    Args:
+        messages: Conversation, modified in place (only ever appended to)
+        turns_in_full: Number of most recent AI turns whose results are kept whole
+        start: Index returned by the previous call (messages before it are done)
+        
+    Returns:
+        Index to pass as `start` on the next call
+    """
+    # Find the oldest AI turn that is still kept whole
+    boundary = len(messages)
+    seen_turns = 0
+    while seen_turns < turns_in_full:
+        boundary -= 1
+        if boundary < start:
+            return start
+        if isinstance(messages[boundary], AIMessage):
+            seen_turns += 1
+    
+    for index in range(start, boundary):
+        message = messages[index]
+        if (
+            isinstance(message, ToolMessage)
+            and isinstance(message.content, str)
+            and len(message.content) > _STALE_RESULT_PREVIEW
+        ):
+            # Copy so name, status and artifact survive - an errored result
+            # must still read as an error once it is cut down
+            messages[index] = message.model_copy(update={
+                "content": message.content[:_STALE_RESULT_PREVIEW] + "... [truncated earlier result]"
+            })
+    return boundary
+
+
+def _stream_turn(
+    llm_with_tools,
+    messages: List[Any],
+    tools_by_name: Dict[str, Any],
+    state_cache: Dict[Tuple[str, str], Any]
+) -> Tuple[Any, Dict[str, Future]]:
+    """
+    Stream one LLM turn, starting read-only tool calls as soon as they are complete.
+    
+    A tool call's arguments are final once the stream moves on to the next
+    call, so read-only calls start executing while the model is still
+    generating the rest of the turn. Calls after an order-placing tool are
+    left to _execute_tool_calls so they still run after the order.
+    
+    Args:
+        llm_with_tools: LLM with tools bound
+        messages: Conversation so far
+        tools_by_name: Bound tools keyed by name
+        state_cache: Cached account-state tool results (calls it can answer aren't started)
+        
+    Returns:
+        (complete response message, futures of the early-started calls keyed by tool_call_id)
+    """
+    prefetched: Dict[str, Future] = {}
+    started: Dict[Tuple[str, str], Future] = {}
+    response = None
+    handled = 0
+    after_order = False
+    
+    try:
+        for chunk in llm_with_tools.stream(messages):
+            response = chunk if response is None else response + chunk
+            
+            # Chunks are merged per call index; all but the last are complete
+            tool_chunks = response.tool_call_chunks
+            for tool_chunk in tool_chunks[handled:len(tool_chunks) - 1]:
+                handled += 1
+                tool = tools_by_name.get(tool_chunk.get('name'))
+                if after_order or tool is None or not tool_chunk.get('id'):
+                    continue
+                if tool.name not in ALLOWED_TOOL_NAMES:
+                    after_order = True
+                    continue
+                try:
+                    tool_args = json.loads(tool_chunk.get('args') or '{}')
+                except ValueError:
+                    continue
+                if not isinstance(tool_args, dict):
+                    continue
+                call_key = _tool_call_key(tool.name, tool_args)
+                if tool.name in _ACCOUNT_STATE_TOOL_NAMES and call_key in state_cache:
+                    continue
+                # Identical calls in one turn share a single execution
+                if call_key not in started:
+                    started[call_key] = _PREFETCH_EXECUTOR.submit(_invoke_tool, tool, tool_args)
+                prefetched[tool_chunk['id']] = started[call_key]
+    except BaseException:
+        # The turn failed, so nobody will collect these results - drop the
+        # calls that haven't started and let the running ones finish
+        for future in started.values():
+            future.cancel()
+        wait(started.values())
+        raise
+    
+    if response is None:
+        return llm_with_tools.invoke(messages), prefetched
+    return message_chunk_to_message(response), prefetched
+
+
+def _tool_call_key(tool_name: str, tool_args: Dict[str, Any]) -> Tuple[str, str]:
+    """Identity of a tool call: name plus canonicalized arguments"""
+    return tool_name, json.dumps(tool_args, sort_keys=True, default=str)
+
+
+def _execute_tool_calls(
+    tool_calls: List[Dict[str, Any]],
+    tools_by_name: Dict[str, Any],
+    state_cache: Optional[Dict[Tuple[str, str], Any]] = None,
+    prefetched: Optional[Dict[str, Future]] = None
+) -> List[Any]:
+    """
+    Execute the tool calls from one LLM turn.
+    
+    Consecutive read-only tools (ALLOWED_TOOL_NAMES) are dispatched together
+    so their round trips overlap, and identical read calls among them (same
+    name and arguments) run once with the result fanned out to every call.
+    Any other tool (order placement) is a barrier: it runs alone, after the
+    reads requested before it and before the ones requested after it, so
+    cash checks always see prior orders.
+    
+    Args:
+        tool_calls: Tool calls from the LLM response
+        tools_by_name: Bound tools keyed by name
+        state_cache: Results of account-state tools (_ACCOUNT_STATE_TOOL_NAMES)
+            kept across turns of one decision run. Repeat calls are answered
+            from it; it is cleared whenever an order-placing tool runs.
+        
+    Returns:
+        One entry per tool call, in call order: the tool result, the raised
+        exception, or _TOOL_NOT_FOUND
+    """
+    if state_cache is None:
+        state_cache = {}
+    if prefetched is None:
+        prefetched = {}
+    outcomes: List[Any] = [_TOOL_NOT_FOUND] * len(tool_calls)
+    pending_reads: List[Tuple[int, Any, Dict[str, Any]]] = []
+    # First index of each distinct read since the last barrier, and the
+    # index each duplicate takes its outcome from
+    first_read: Dict[Tuple[str, str], int] = {}
+    duplicate_of: Dict[int, int] = {}
+    
+    def flush_reads():
+        for (index, tool, tool_args), outcome in zip(pending_reads, _gather_tool_calls(pending_reads)):
+            outcomes[index] = outcome
+            if tool.name in _ACCOUNT_STATE_TOOL_NAMES and not isinstance(outcome, Exception):
+                state_cache[_tool_call_key(tool.name, tool_args)] = outcome
+        pending_reads.clear()
+    
+    for index, tool_call in enumerate(tool_calls):
+        tool = tools_by_name.get(tool_call.get('name', 'unknown'))
+        if tool is None:
+            continue
+        tool_args = tool_call.get('args', {})
+        if tool.name in ALLOWED_TOOL_NAMES:
+            call_key = _tool_call_key(tool.name, tool_args)
+            if tool.name in _ACCOUNT_STATE_TOOL_NAMES and call_key in state_cache:
+                outcomes[index] = state_cache[call_key]
+                continue
+            if call_key in first_read:
+                duplicate_of[index] = first_read[call_key]
+                continue
+            first_read[call_key] = index
+            future = prefetched.get(tool_call.get('id', ''))
+            if future is not None:
+                outcomes[index] = future.result()
+                if tool.name in _ACCOUNT_STATE_TOOL_NAMES and not isinstance(outcomes[index], Exception):
+                    state_cache[call_key] = outcomes[index]
+                continue
+            pending_reads.append((index, tool, tool_args))
+            continue
+        if pending_reads:
+            flush_reads()
+        outcomes[index] = _invoke_tool(tool, tool_args)
+        # An order may have changed cash, positions and open orders
+        state_cache.clear()
+        first_read.clear()
+    
+    if pending_reads:
+        flush_reads()
+    for index, first in duplicate_of.items():
+        outcomes[index] = outcomes[first]
+    return outcomes
+
+
 def make_decisions_node(state: PortfolioState) -> Dict[str, Any]:
     """
     [LLM NODE - AUTONOMOUS TRADING]
@@ -278,16 +586,14 @@ def make_decisions_node(state: PortfolioState) -> Dict[str, Any]:
         account = state.get("account", {})
         positions = state.get("positions", [])
         
-        # Import exit strategy and stock template (only in this node to save tokens)
-        from .stock_prompt_template import EXIT_STRATEGY_GUIDANCE
-        from .stock_prompt_template import generate_stock_portfolio_prompt
-        
         # Get LLM with function calling capabilities
         llm = get_agent_llm(config)
         
-        # Get SAFE trading tools (filtered + bracket order tool)
-        all_alpaca_tools = get_alpaca_mcp_tools()
-        safe_tools = get_safe_trading_tools(all_alpaca_tools)
+        # Get SAFE trading tools (filtered + bracket order tool), built once per process
+        safe_tools, tools_by_name, tools_text = _get_safe_tools()
+        
+        # Account-state tool results reused across turns until an order is placed
+        state_cache: Dict[Tuple[str, str], Any] = {}
         
         # Bind safe tools to LLM for native OpenAI function calling
         llm_with_tools = llm.bind_tools(safe_tools)
@@ -296,16 +602,13 @@ def make_decisions_node(state: PortfolioState) -> Dict[str, Any]:
         last_summary = state.get('last_summary', '')
         
         run_count = 1
-        if last_summary and "Run #" in last_summary:
-            import re
-            match = re.search(r'Run #(\d+)', last_summary)
-            if match:
-                run_count = int(match.group(1))
+        match = _RUN_COUNT_RE.search(last_summary) if last_summary else None
+        if match:
+            run_count = int(match.group(1))
         
         # Generate comprehensive stock portfolio prompt with live data
         # Convert state to dict for the prompt generator
         # Note: start_time will be extracted from last_summary by the prompt generator
-        from typing import cast
         state_dict = cast(Dict[str, Any], dict(state))
         stock_context = generate_stock_portfolio_prompt(
             state=state_dict,
@@ -313,17 +616,22 @@ def make_decisions_node(state: PortfolioState) -> Dict[str, Any]:
             start_time=None  # Let prompt template extract from last_summary
         )
         
-        # Build tool list for the prompt
-        tool_descriptions = []
-        for tool in safe_tools:
-            tool_descriptions.append(f"  - {tool.name}: {tool.description}")
-        tools_text = "\n".join(tool_descriptions)
-        
         # Build comprehensive decision prompt with tool access
         cash_available = account.get('cash', 0)
         portfolio_value = account.get('portfolio_value', 0)
         num_positions = len(positions)
         
+        # Open orders were already fetched during assessment - list them so
+        # the agent doesn't spend a turn on get_open_orders to see them
+        open_orders = state.get("open_orders", [])
+        if open_orders:
+            open_orders_text = "\n".join([
+                f"  - {o.get('side')} {o.get('ticker')}: {o.get('qty')} shares, {o.get('order_type')} ({o.get('status')})"
+                for o in open_orders
+            ])
+        else:
+            open_orders_text = "  (No open orders)"
+        
         prompt = f"""{stock_context}
 
 AVAILABLE SAFE TOOLS:
@@ -340,6 +648,12 @@ CURRENT PORTFOLIO:
 - Cash Available: ${cash_available:,.2f}
 - Portfolio Value: ${portfolio_value:,.2f}
 - Active Positions: {num_positions}
+- Open Orders: {len(open_orders)}
+{open_orders_text}
+
+The account, positions, open orders and market status above were fetched at
+the start of this run. Use them directly - only call get_account,
+get_positions or get_open_orders to re-check after you place an order.
 
 YOUR WORKFLOW:
 1. ANALYZE: Use get_stock_snapshot() or get_stock_quote() to check stocks
@@ -388,80 +702,86 @@ NOW: Analyze stocks and PLACE bracket orders if opportunities are found."""
         model_tag = get_model_tag(llm)
         logger.info(f"[SYSTEM] 🤖 {model_tag} is analyzing portfolio and making trading decisions...")
         
-        from langchain_core.messages import ToolMessage
-        
         max_iterations = 20  # Safety limit to prevent infinite loops
+        info_on = logger.isEnabledFor(logging.INFO)
+        compacted_upto = 0
         iteration = 0
         
         while iteration < max_iterations:
             iteration += 1
             
-            # Call LLM
-            response = llm_with_tools.invoke(messages)
+            # Keep the resent conversation bounded as tool results pile up
+            compacted_upto = _compact_tool_results(messages, _FULL_RESULT_TURNS, compacted_upto)
+            
+            # Call LLM, streaming so read-only tool calls can start early
+            response, prefetched = _stream_turn(llm_with_tools, messages, tools_by_name, state_cache)
             messages.append(response)
             
             # Check if LLM wants to use tools
             if hasattr(response, 'tool_calls') and response.tool_calls:
                 logger.info(f"[SYSTEM] 🔧 LLM requested {len(response.tool_calls)} tool call(s)")
                 
-                # Execute all tool calls (LLM can request multiple at once)
-                for tool_call in response.tool_calls:
+                # Log every requested call, then execute them (read-only
+                # calls concurrently, orders one at a time)
+                if info_on:
+                    for tool_call in response.tool_calls:
+                        args_str = ", ".join([f"{k}={v}" for k, v in tool_call.get('args', {}).items()])
+                        logger.info(f"[SYSTEM]   🔧 Calling: {tool_call.get('name', 'unknown')}({args_str})")
+                
+                outcomes = _execute_tool_calls(response.tool_calls, tools_by_name, state_cache, prefetched)
+                
+                for tool_call, result in zip(response.tool_calls, outcomes):
                     tool_name = tool_call.get('name', 'unknown')
                     tool_args = tool_call.get('args', {})
                     tool_id = tool_call.get('id', '')
                     
-                    # Log the tool call
-                    args_str = ", ".join([f"{k}={v}" for k, v in tool_args.items()])
-                    logger.info(f"[SYSTEM]   🔧 Calling: {tool_name}({args_str})")
+                    if result is _TOOL_NOT_FOUND:
+                        logger.warning(f"[SYSTEM]   ⚠️  Tool {tool_name} not found")
+                        continue
                     
-                    # Find and execute the tool
-                    matching_tools = [t for t in safe_tools if t.name == tool_name]
+                    if isinstance(result, Exception):
+                        error_msg = f"Error executing {tool_name}: {str(result)}"
+                        logger.error(f"[SYSTEM]   ❌ {error_msg}")
+                        
+                        # Add error to messages
+                        messages.append(ToolMessage(
+                            content=error_msg,
+                            tool_call_id=tool_id
+                        ))
+                        continue
                     
-                    if matching_tools:
-                        tool = matching_tools[0]
-                        try:
-                            # Execute tool
-                            result = tool.invoke(tool_args)
-                            logger.info(f"[SYSTEM]   ✅ {tool_name} result: {str(result)[:200]}...")
-                            
-                            # Track trade executions (only place_buy_bracket_order is allowed)
-                            # Only track successful trades (check result status)
-                            if tool_name == 'place_buy_bracket_order':
-                                # Check if the order was successfully placed
-                                if isinstance(result, dict) and result.get('status') == 'success':
-                                    executed_trades.append({
-                                        'ticker': tool_args.get('symbol', 'UNKNOWN'),
-                                        'action': 'BUY',  # Always BUY since this tool only does BUY orders
-                                        'quantity': tool_args.get('qty', 0),
-                                        'order_type': tool_args.get('type', 'market'),
-                                        'stop_loss_price': tool_args.get('stop_loss_price'),
-                                        'take_profit_price': tool_args.get('take_profit_price'),
-                                        'status': 'submitted',
-                                        'executed_at': datetime.now().isoformat(),
-                                        'order_id': result.get('order_id'),
-                                        'tool_result': str(result)[:500]
-                                    })
-                                else:
-                                    # Log failed trade attempt but don't add to executed_trades
-                                    logger.warning(f"[SYSTEM]   ⚠️  Trade failed: {result.get('error', 'Unknown error')}")
-                            
-                            # Add tool result to messages
-                            messages.append(ToolMessage(
-                                content=str(result),
-                                tool_call_id=tool_id
-                            ))
-                            
-                        except Exception as e:
-                            error_msg = f"Error executing {tool_name}: {str(e)}"
-                            logger.error(f"[SYSTEM]   ❌ {error_msg}")
-                            
-                            # Add error to messages
-                            messages.append(ToolMessage(
-                                content=error_msg,
-                                tool_call_id=tool_id
-                            ))
-                    else:
-                        logger.warning(f"[SYSTEM]   ⚠️  Tool {tool_name} not found")
+                    # Stringify once - reused for the log preview, the trade
+                    # record and the ToolMessage
+                    result_text = str(result)
+                    if info_on:
+                        logger.info("[SYSTEM]   ✅ %s result: %.200s...", tool_name, result_text)
+                    
+                    # Track trade executions (only place_buy_bracket_order is allowed)
+                    # Only track successful trades (check result status)
+                    if tool_name == 'place_buy_bracket_order':
+                        # Check if the order was successfully placed
+                        if isinstance(result, dict) and result.get('status') == 'success':
+                            executed_trades.append({
+                                'ticker': tool_args.get('symbol', 'UNKNOWN'),
+                                'action': 'BUY',  # Always BUY since this tool only does BUY orders
+                                'quantity': tool_args.get('qty', 0),
+                                'order_type': tool_args.get('type', 'market'),
+                                'stop_loss_price': tool_args.get('stop_loss_price'),
+                                'take_profit_price': tool_args.get('take_profit_price'),
+                                'status': 'submitted',
+                                'executed_at': datetime.now().isoformat(),
+                                'order_id': result.get('order_id'),
+                                'tool_result': result_text[:500]
+                            })
+                        else:
+                            # Log failed trade attempt but don't add to executed_trades
+                            logger.warning(f"[SYSTEM]   ⚠️  Trade failed: {result.get('error', 'Unknown error')}")
+                    
+                    # Add tool result to messages
+                    messages.append(ToolMessage(
+                        content=result_text,
+                        tool_call_id=tool_id
+                    ))
                 
                 # Continue loop to let LLM decide on next action
                 continue
@@ -494,7 +814,6 @@ NOW: Analyze stocks and PLACE bracket orders if opportunities are found."""
         }
             
     except Exception as e:
-        import traceback
         traceback.print_exc()
         logger.error(f"[SYSTEM] ❌ Error in decision making: {e}", exc_info=True)
         return {
@@ -525,6 +844,11 @@ def update_summary_node(state: PortfolioState) -> Dict[str, Any]:
     """
     logger.info("[SYSTEM] 📝 [SUMMARY] Updating agent memory...")
     
+    # One timestamp for the whole summary so its iteration ID, dates and
+    # run header always agree
+    now = datetime.now()
+    run_date = now.strftime('%Y-%m-%d %H:%M:%S')
+    
     try:
         # Check if market was closed - skip summary creation entirely
         phase = state.get("phase", "")
@@ -544,12 +868,12 @@ def update_summary_node(state: PortfolioState) -> Dict[str, Any]:
         # Check if there was an error in assessment - save error summary
         if phase == "error":
             error_msg = state.get("error", "Unknown error occurred")
-            iteration_id = state.get("iteration_id", datetime.now().strftime("%Y%m%d_%H%M%S"))
+            iteration_id = state.get("iteration_id", now.strftime("%Y%m%d_%H%M%S"))
             
             logger.error("[SYSTEM] ❌ Error occurred - creating error summary")
             
             summary = f"""ERROR SUMMARY
-Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Run Date: {run_date}
 Iteration ID: {iteration_id}
 Status: Error occurred during portfolio assessment
 
@@ -575,7 +899,7 @@ Next Steps: Check logs and fix the issue before running again
             
             # Try to save error summary to S3
             try:
-                s3_manager = S3ReportManager(s3_bucket, s3_region)
+                s3_manager = get_s3_report_manager(s3_bucket, s3_region)
                 s3_manager.save_summary(summary, iteration_id)
                 logger.info("[SYSTEM] ✅ Error summary saved to S3")
                 logger.info(f"[SYSTEM] 📁 S3 Path: s3://{s3_bucket}/portfolio_manager/summaries/")
@@ -598,8 +922,8 @@ Next Steps: Check logs and fix the issue before running again
             logger.error("[SYSTEM] ❌ S3 bucket not configured! S3 operations are REQUIRED.")
             raise ValueError("S3_BUCKET_NAME must be configured in environment variables")
         
-        s3_manager = S3ReportManager(s3_bucket, s3_region)
-        iteration_id = state.get("iteration_id", datetime.now().strftime("%Y%m%d_%H%M%S"))
+        s3_manager = get_s3_report_manager(s3_bucket, s3_region)
+        iteration_id = state.get("iteration_id", now.strftime("%Y%m%d_%H%M%S"))
         
         # Gather state for summary
         account = state.get('account', {})
@@ -609,18 +933,33 @@ Next Steps: Check logs and fix the issue before running again
         
         # Parse previous run count and calculate new
         run_count = 1
-        if last_summary and "Run #" in last_summary:
-            import re
-            match = re.search(r'Run #(\d+)', last_summary)
-            if match:
-                run_count = int(match.group(1)) + 1
+        match = _RUN_COUNT_RE.search(last_summary) if last_summary else None
+        if match:
+            run_count = int(match.group(1)) + 1
+        
+        # Pre-render the position and trade lists so the prompt is a single
+        # f-string with no nested joins
+        if positions:
+            positions_text = "\n".join([
+                f"  - {p.get('symbol')}: {p.get('qty')} shares @ ${p.get('current_price', 0):.2f}, Market Value: ${p.get('market_value', 0):,.2f}, P&L: {(p.get('unrealized_plpc', 0) * 100):+.1f}%"
+                for p in positions
+            ])
+        else:
+            positions_text = "  (No positions)"
+        if executed_trades:
+            trades_text = "\n".join([
+                f"  - {t.get('action')} {t.get('ticker')}: Qty={t.get('quantity', 'N/A')}, Stop Loss=${t.get('stop_loss_price', 'N/A')}, Take Profit=${t.get('take_profit_price', 'N/A')}"
+                for t in executed_trades
+            ])
+        else:
+            trades_text = "  (No trades executed)"
         
         # Build context for LLM summary
         summary_prompt = f"""You are a portfolio management system. Generate a comprehensive summary that will serve as MEMORY for the next run.
 
 ITERATION: {iteration_id}
 RUN NUMBER: {run_count}
-DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+DATE: {run_date}
 
 CURRENT PORTFOLIO STATE:
 - Cash Available: ${account.get('cash', 0):,.2f}
@@ -628,18 +967,18 @@ CURRENT PORTFOLIO STATE:
 - Number of Positions: {len(positions)}
 
 POSITIONS:
-{chr(10).join([f"  - {p.get('symbol')}: {p.get('qty')} shares @ ${p.get('current_price', 0):.2f}, Market Value: ${p.get('market_value', 0):,.2f}, P&L: {(p.get('unrealized_plpc', 0) * 100):+.1f}%" for p in positions]) if positions else "  (No positions)"}
+{positions_text}
 
 THIS RUN:
 - Trades Executed: {len(executed_trades)}
 
 EXECUTED TRADES:
-{chr(10).join([f"  - {t.get('action')} {t.get('ticker')}: Qty={t.get('quantity', 'N/A')}, Stop Loss=${t.get('stop_loss_price', 'N/A')}, Take Profit=${t.get('take_profit_price', 'N/A')}" for t in executed_trades]) if executed_trades else "  (No trades executed)"}
+{trades_text}
 
 Generate a memory summary in this EXACT format:
 
 ## MEMORY SUMMARY
-Run #{run_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Run #{run_count} - {run_date}
 
 ### PORTFOLIO STATUS
 (Current state and performance)
@@ -656,7 +995,6 @@ Run #{run_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Keep it concise but informative. This is the agent's memory for continuity."""
         
         # Generate summary using LLM
-        from shared.llm_factory import get_quick_llm
         llm = get_quick_llm(config)
         model_tag = get_model_tag(llm)
         response = llm.invoke([HumanMessage(content=summary_prompt)])
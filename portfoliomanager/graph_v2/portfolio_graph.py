@@ -9,7 +9,10 @@ Connects all nodes into a coherent workflow with:
 - Streaming capabilities
 """
 
+import sys
 from datetime import datetime
+from functools import lru_cache
+from uuid import uuid4
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 
@@ -20,6 +23,15 @@ from .nodes import (
     update_summary_node
 )
 
+# Separator for the streaming progress banners
+_SEP = "=" * 60
+
+
+def _write_progress(text: str):
+    """Write a block of progress output to stdout in one call and flush it"""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
 
 def create_portfolio_graph(config: dict, enable_checkpointing: bool = True):
     """
@@ -129,6 +141,22 @@ def create_portfolio_graph(config: dict, enable_checkpointing: bool = True):
         return workflow.compile()
 
 
+@lru_cache(maxsize=2)
+def _get_compiled_graph(enable_checkpointing: bool = True):
+    """
+    Get the compiled portfolio graph, compiling it only once per process.
+    
+    The graph's structure doesn't depend on the config (it reaches the nodes
+    through the state), so scheduled iterations reuse one compiled graph.
+    Each iteration runs on its own thread_id and clears its checkpoints when
+    it finishes, so the shared MemorySaver doesn't grow across runs.
+    
+    iteration_id only has one-second resolution, so thread IDs get a random
+    suffix to keep runs started in the same second from sharing a thread.
+    """
+    return create_portfolio_graph({}, enable_checkpointing=enable_checkpointing)
+
+
 # HITL functionality removed - system is fully autonomous
 
 
@@ -154,8 +182,8 @@ def run_portfolio_iteration(config: dict):
         >>> print(f"Executed {len(result['executed_trades'])} trades")
     """
     
-    # Create graph with checkpointing for error recovery
-    graph = create_portfolio_graph(config, enable_checkpointing=True)
+    # Compiled graph (with checkpointing for error recovery) is shared across iterations
+    graph = _get_compiled_graph(enable_checkpointing=True)
     
     # Create initial state
     iteration_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -171,8 +199,12 @@ def run_portfolio_iteration(config: dict):
     
     # Run graph to completion (fully autonomous)
     # Include thread_id for checkpointing support
-    run_config = {"configurable": {"thread_id": iteration_id}}
-    return graph.invoke(initial_state, config=run_config)
+    thread_id = f"{iteration_id}-{uuid4().hex}"
+    run_config = {"configurable": {"thread_id": thread_id}}
+    try:
+        return graph.invoke(initial_state, config=run_config)
+    finally:
+        graph.checkpointer.delete_thread(thread_id)
 
 
 async def stream_portfolio_iteration(config: dict):
@@ -191,7 +223,7 @@ async def stream_portfolio_iteration(config: dict):
         >>> asyncio.run(stream_portfolio_iteration(PORTFOLIO_CONFIG))
     """
     
-    graph = create_portfolio_graph(config)
+    graph = _get_compiled_graph(enable_checkpointing=True)
     
     # Create initial state
     iteration_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -206,49 +238,52 @@ async def stream_portfolio_iteration(config: dict):
         "error": None
     }
     
-    print("\n" + "="*60)
-    print(f"🚀 Starting Portfolio Iteration: {iteration_id}")
-    print("="*60)
+    # Each block is written with one stdout write + flush instead of a
+    # print() per line
+    _write_progress(f"\n{_SEP}\n🚀 Starting Portfolio Iteration: {iteration_id}\n{_SEP}")
     
     # Stream events with thread_id for checkpointing
-    run_config = {"configurable": {"thread_id": iteration_id}}
-    async for event in graph.astream(initial_state, config=run_config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        
-        phase = node_output.get("phase", "unknown")
-        print(f"\n✓ Completed: {node_name} (phase: {phase})")
-        
-        # Show key information per node
-        if node_name == "assess_portfolio":
-            if phase == "market_closed":
-                error_msg = node_output.get("error", "Market is closed")
-                print(f"  🚫 {error_msg}")
-                print(f"  ⏸️  Trading suspended")
-            else:
-                account = node_output.get("account", {})
-                last_summary = node_output.get("last_summary", "")
-                print(f"  💰 Cash: ${account.get('cash', 0):,.2f}")
-                print(f"  📈 Portfolio: ${account.get('portfolio_value', 0):,.2f}")
-                if last_summary:
-                    print(f"  📜 Loaded memory from previous run")
-        
-        elif node_name == "make_decisions":
-            if phase == "market_closed":
-                print(f"  🚫 Skipped (market closed)")
-            else:
-                executed = node_output.get("executed_trades", [])
-                print(f"  ⚡ Executed {len(executed)} trades")
-        
-        elif node_name == "update_summary":
-            if phase == "complete":
-                run_count = node_output.get("run_count", 1)
-                if run_count > 0:
-                    print(f"  📝 Updated agent memory (Run #{run_count})")
+    thread_id = f"{iteration_id}-{uuid4().hex}"
+    run_config = {"configurable": {"thread_id": thread_id}}
+    try:
+        async for event in graph.astream(initial_state, config=run_config):
+            node_name = list(event.keys())[0]
+            node_output = event[node_name]
+            
+            phase = node_output.get("phase", "unknown")
+            lines = [f"\n✓ Completed: {node_name} (phase: {phase})"]
+            
+            # Show key information per node
+            if node_name == "assess_portfolio":
+                if phase == "market_closed":
+                    error_msg = node_output.get("error", "Market is closed")
+                    lines.append(f"  🚫 {error_msg}")
+                    lines.append("  ⏸️  Trading suspended")
+                else:
+                    account = node_output.get("account", {})
+                    last_summary = node_output.get("last_summary", "")
+                    lines.append(f"  💰 Cash: ${account.get('cash', 0):,.2f}")
+                    lines.append(f"  📈 Portfolio: ${account.get('portfolio_value', 0):,.2f}")
+                    if last_summary:
+                        lines.append("  📜 Loaded memory from previous run")
+            
+            elif node_name == "make_decisions":
+                if phase == "market_closed":
+                    lines.append("  🚫 Skipped (market closed)")
                 else:
-                    print(f"  📝 Market closed summary saved")
+                    executed = node_output.get("executed_trades", [])
+                    lines.append(f"  ⚡ Executed {len(executed)} trades")
+            
+            elif node_name == "update_summary":
+                if phase == "complete":
+                    run_count = node_output.get("run_count", 1)
+                    if run_count > 0:
+                        lines.append(f"  📝 Updated agent memory (Run #{run_count})")
+                    else:
+                        lines.append("  📝 Market closed summary saved")
+            
+            _write_progress("\n".join(lines))
+    finally:
+        await graph.checkpointer.adelete_thread(thread_id)
     
-    print("\n" + "="*60)
-    print("✅ Iteration Complete!")
-    print("="*60)
-
+    _write_progress(f"\n{_SEP}\n✅ Iteration Complete!\n{_SEP}")
@@ -12,12 +12,24 @@ This module fetches:
 - Account performance and positions
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timedelta
+import io
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Section separators shared by both prompt generators
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+
+# Number of most recent bars shown for each series
+_TAIL = 10
+
+# Timestamp in "Run #X - YYYY-MM-DD HH:MM:SS" summary headers, one group per field
+_SUMMARY_TIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})')
+
 
 # ==================== Exit Strategy Guidance ====================
 
@@ -93,21 +105,98 @@ NEVER place orders that would make your cash balance negative!
 """
 
 
-def generate_stock_portfolio_prompt(
+# ==================== Static Prompt Blocks ====================
+
+# Data-ordering boilerplate that follows the live-data prompt header
+_LIVE_DATA_PREAMBLE = (
+    "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST\n\n"
+    "Timeframes note: Unless stated otherwise, "
+    "intraday series are provided at 15-minute intervals.\n\n"
+    f"{_SEP_EQ}\n"
+)
+
+# Market opportunities guide, up to the cash-dependent position sizing line
+_MARKET_OPPORTUNITIES_GUIDE = (
+    "\nMARKET OPPORTUNITIES\n"
+    f"{_SEP_EQ}\n"
+    "Use the available tools to find trading opportunities:\n"
+    "1. get_stock_snapshot(symbol) - Get comprehensive real-time data for any stock\n"
+    "2. get_stock_quote(symbol) - Get current bid/ask prices\n"
+    "3. get_stock_bars(symbol, timeframe='15Min', days=1) - Get price history\n"
+    "\n"
+    "Consider stocks from major indices:\n"
+    "- Tech: AAPL, MSFT, GOOGL, META, NVDA, TSLA, AMZN\n"
+    "- Finance: JPM, BAC, GS, MS, V, MA\n"
+    "- Healthcare: JNJ, UNH, PFE, ABBV, LLY\n"
+    "- Consumer: WMT, HD, DIS, NKE, COST\n"
+    "- Energy: XOM, CVX, COP\n"
+    "- Or any other stock you find interesting\n"
+    "\n"
+    "PROCESS:\n"
+    "1. Use tools to check real-time prices and trends for stocks\n"
+    "2. Identify stocks with good momentum or value\n"
+    "3. Place bracket orders with appropriate stop-loss and take-profit\n"
+)
+
+
+# ==================== Per-Symbol Section Template ====================
+
+# Filled with str.format_map() once per symbol in
+# generate_stock_trading_prompt_with_live_data()
+_STOCK_SECTION_TMPL = (
+    "\nALL {symbol} DATA\n"
+    "{sep}\n"
+    "current_price = {current_price:.2f}, "
+    "current_ema20 = {current_ema20:.2f}, "
+    "current_macd = {current_macd:.3f}, "
+    "current_rsi (14 period) = {current_rsi14:.3f}\n"
+    "\nIn addition, here is the latest {symbol} volume and volatility metrics:\n"
+    "Average Volume (20-day): {avg_volume_20d:,.0f}  "
+    "Current Volume: {current_volume:,.0f}\n"
+    "ATR (14-day): {atr14_daily:.2f}  "
+    "ATR (30-day): {atr30_daily:.2f}\n"
+    "\nIntraday series (15-minute intervals, oldest → latest):\n"
+    "{symbol} prices: {last_10_prices}\n"
+    "EMA indicators (20-period): {last_10_ema20}\n"
+    "MACD indicators: {last_10_macd}\n"
+    "RSI indicators (14-Period): {last_10_rsi}\n"
+    "Volume series: {last_10_volumes}\n"
+    "\nLonger-term context (daily timeframe):\n"
+    "20-Day SMA: {sma20_daily:.2f} vs. 50-Day SMA: {sma50_daily:.2f}\n"
+    "14-Day ATR: {atr14_daily:.2f} vs. 30-Day ATR: {atr30_daily:.2f}\n"
+    "Current Volume: {daily_volume:,.0f} vs. Average Volume (20-day): {avg_volume_20d:,.0f}\n"
+    "MACD indicators (daily): {last_10_macd_daily}\n"
+    "RSI indicators (14-Period daily): {last_10_rsi_daily}\n"
+)
+
+# Stanza written instead of the section above when a symbol has no bars
+_NO_DATA_TMPL = (
+    "\nALL {symbol} DATA\n"
+    "{sep}\n"
+    "No market data available\n"
+    "{end}\n"
+)
+
+
+
+def _iter_stock_portfolio_prompt(
     state: Dict[str, Any],
     iteration_count: int = 0,
     start_time: Optional[datetime] = None
-) -> str:
+) -> Iterator[str]:
     """
-    Generate a comprehensive prompt for LLM with current portfolio state and market data.
+    Yield the portfolio prompt section by section.
+    
+    Chunks concatenate to the full prompt, so callers that forward or hash the
+    prompt incrementally can consume them without building the whole string.
     
     Args:
         state: Portfolio state containing account, positions, market data
         iteration_count: Number of times the portfolio manager has been invoked
         start_time: When the portfolio manager started running
         
-    Returns:
-        Formatted prompt string with all market state and portfolio data
+    Yields:
+        Prompt chunks; every chunk but the last ends with a newline
     """
     
     # Extract state data
@@ -118,20 +207,23 @@ def generate_stock_portfolio_prompt(
     
     # Parse start time from last_summary if available
     if start_time is None and last_summary:
-        import re
         # Try to extract date from "Run #X - YYYY-MM-DD HH:MM:SS" format in summary
-        match = re.search(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})', last_summary)
+        match = _SUMMARY_TIME_RE.search(last_summary)
         if match:
+            # The regex already isolated each field - build the datetime
+            # directly instead of re-parsing the text with strptime
             try:
-                start_time = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-            except:
+                y, mo, d, h, mi, sec = map(int, match.groups())
+                start_time = datetime(y, mo, d, h, mi, sec)
+            except ValueError:
                 pass
     
+    now = datetime.now()
     if start_time is None:
-        start_time = datetime.now()
+        start_time = now
     
-    minutes_since_start = int((datetime.now() - start_time).total_seconds() / 60)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    minutes_since_start = int((now - start_time).total_seconds() / 60)
+    current_time = now.strftime("%Y-%m-%d %H:%M:%S")
     
     # Calculate portfolio metrics
     portfolio_value = account.get("portfolio_value", 0)
@@ -142,16 +234,13 @@ def generate_stock_portfolio_prompt(
     last_equity = account.get("last_equity", portfolio_value)
     total_return_pct = ((portfolio_value - last_equity) / last_equity * 100) if last_equity > 0 else 0.0
     
-    # Start building the prompt
-    prompt_parts = []
-    
     # ==================== Header ====================
-    prompt_parts.append(
+    yield (
         f"PORTFOLIO MANAGER STATUS\n"
-        f"{'=' * 80}\n"
+        f"{_SEP_EQ}\n"
         f"Current Time: {current_time}\n"
         f"Run #{iteration_count} (running for {minutes_since_start} minutes since {start_time.strftime('%H:%M:%S')})\n"
-        f"{'=' * 80}"
+        f"{_SEP_EQ}\n"
     )
     
     # ==================== Market Status ====================
@@ -159,34 +248,34 @@ def generate_stock_portfolio_prompt(
     next_open = market_clock.get("next_open", "N/A")
     next_close = market_clock.get("next_close", "N/A")
     
-    prompt_parts.append(
+    yield (
         f"\nMARKET STATUS\n"
-        f"{'=' * 80}\n"
-        f"Market is currently: {'OPEN ✅' if is_open else 'CLOSED 🚫'}"
+        f"{_SEP_EQ}\n"
+        f"Market is currently: {'OPEN ✅' if is_open else 'CLOSED 🚫'}\n"
     )
     if not is_open:
-        prompt_parts.append(f"Next open: {next_open}")
+        yield f"Next open: {next_open}\n"
     else:
-        prompt_parts.append(f"Next close: {next_close}")
+        yield f"Next close: {next_close}\n"
     
-    prompt_parts.append("=" * 80)
+    yield f"{_SEP_EQ}\n"
     
     # ==================== Account Summary ====================
-    prompt_parts.append(
+    yield (
         f"\nACCOUNT SUMMARY\n"
-        f"{'=' * 80}\n"
+        f"{_SEP_EQ}\n"
         f"Available Cash: ${cash:,.2f}\n"
         f"Portfolio Value: ${portfolio_value:,.2f}\n"
         f"Total Equity: ${equity:,.2f}\n"
         f"Total Return: {total_return_pct:+.2f}%\n"
-        f"{'=' * 80}"
+        f"{_SEP_EQ}\n"
     )
     
     # ==================== Current Positions ====================
     if positions:
-        prompt_parts.append(
+        yield (
             f"\nCURRENT POSITIONS ({len(positions)})\n"
-            f"{'=' * 80}"
+            f"{_SEP_EQ}\n"
         )
         for pos in positions:
             symbol = pos.get("symbol", "UNKNOWN")
@@ -196,54 +285,53 @@ def generate_stock_portfolio_prompt(
             unrealized_pl_pct = pos.get("unrealized_plpc", 0) * 100
             market_value = pos.get("market_value", 0)
             
-            prompt_parts.append(
+            yield (
                 f"  {symbol}: {qty:.2f} shares @ ${current_price:.2f} "
-                f"(entry: ${avg_entry:.2f}, P&L: {unrealized_pl_pct:+.1f}%, value: ${market_value:,.2f})"
+                f"(entry: ${avg_entry:.2f}, P&L: {unrealized_pl_pct:+.1f}%, value: ${market_value:,.2f})\n"
             )
-        prompt_parts.append("=" * 80)
+        yield f"{_SEP_EQ}\n"
     else:
-        prompt_parts.append(
+        yield (
             f"\nCURRENT POSITIONS\n"
-            f"{'=' * 80}\n"
+            f"{_SEP_EQ}\n"
             f"No positions currently held - Portfolio is 100% cash\n"
-            f"{'=' * 80}"
+            f"{_SEP_EQ}\n"
         )
     
     # ==================== Last Run Summary ====================
     if last_summary:
-        prompt_parts.append(
+        yield (
             f"\nLAST RUN MEMORY\n"
-            f"{'=' * 80}\n"
+            f"{_SEP_EQ}\n"
             f"{last_summary}\n"
-            f"{'=' * 80}"
+            f"{_SEP_EQ}\n"
         )
     
     # ==================== Market Opportunities Guide ====================
-    prompt_parts.append(
-        f"\nMARKET OPPORTUNITIES\n"
-        f"{'=' * 80}\n"
-        f"Use the available tools to find trading opportunities:\n"
-        f"1. get_stock_snapshot(symbol) - Get comprehensive real-time data for any stock\n"
-        f"2. get_stock_quote(symbol) - Get current bid/ask prices\n"
-        f"3. get_stock_bars(symbol, timeframe='15Min', days=1) - Get price history\n"
-        f"\n"
-        f"Consider stocks from major indices:\n"
-        f"- Tech: AAPL, MSFT, GOOGL, META, NVDA, TSLA, AMZN\n"
-        f"- Finance: JPM, BAC, GS, MS, V, MA\n"
-        f"- Healthcare: JNJ, UNH, PFE, ABBV, LLY\n"
-        f"- Consumer: WMT, HD, DIS, NKE, COST\n"
-        f"- Energy: XOM, CVX, COP\n"
-        f"- Or any other stock you find interesting\n"
-        f"\n"
-        f"PROCESS:\n"
-        f"1. Use tools to check real-time prices and trends for stocks\n"
-        f"2. Identify stocks with good momentum or value\n"
-        f"3. Place bracket orders with appropriate stop-loss and take-profit\n"
+    yield _MARKET_OPPORTUNITIES_GUIDE
+    yield (
         f"4. Aim for positions of ${cash * 0.05:,.2f} - ${cash * 0.10:,.2f} each (5-10% of cash)\n"
-        f"{'=' * 80}"
+        f"{_SEP_EQ}"
     )
+
+
+def generate_stock_portfolio_prompt(
+    state: Dict[str, Any],
+    iteration_count: int = 0,
+    start_time: Optional[datetime] = None
+) -> str:
+    """
+    Generate a comprehensive prompt for LLM with current portfolio state and market data.
     
-    return "\n".join(prompt_parts)
+    Args:
+        state: Portfolio state containing account, positions, market data
+        iteration_count: Number of times the portfolio manager has been invoked
+        start_time: When the portfolio manager started running
+        
+    Returns:
+        Formatted prompt string with all market state and portfolio data
+    """
+    return "".join(_iter_stock_portfolio_prompt(state, iteration_count, start_time))
 
 
 def generate_stock_trading_prompt_with_live_data(
@@ -267,11 +355,12 @@ def generate_stock_trading_prompt_with_live_data(
         Formatted prompt with live market data
     """
     
+    now = datetime.now()
     if start_time is None:
-        start_time = datetime.now()
+        start_time = now
     
-    minutes_since_start = int((datetime.now() - start_time).total_seconds() / 60)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+    minutes_since_start = int((now - start_time).total_seconds() / 60)
+    current_time = now.strftime("%Y-%m-%d %H:%M:%S.%f")
     
     account = state.get("account", {})
     positions = state.get("positions", [])
@@ -283,45 +372,38 @@ def generate_stock_trading_prompt_with_live_data(
     last_equity = account.get("last_equity", portfolio_value)
     total_return_pct = ((portfolio_value - last_equity) / last_equity * 100) if last_equity > 0 else 0.0
     
-    prompt_parts = []
+    buf = io.StringIO()
     
     # Header
-    prompt_parts.append(
+    buf.write(
         f"It has been {minutes_since_start} minutes since you started managing the portfolio. "
         f"The current time is {current_time} and you've been invoked {iteration_count} times. "
         f"Below, we are providing you with a variety of state data, price data, and technical signals "
-        f"so you can discover alpha. Below that is your current account information, value, performance, positions, etc.\n"
-    )
-    prompt_parts.append(
-        "ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST\n"
+        f"so you can discover alpha. Below that is your current account information, value, performance, positions, etc.\n\n"
     )
-    prompt_parts.append(
-        "Timeframes note: Unless stated otherwise, "
-        "intraday series are provided at 15-minute intervals.\n"
-    )
-    prompt_parts.append("=" * 80)
+    buf.write(_LIVE_DATA_PREAMBLE)
     
     # Market Status
     is_open = market_clock.get("is_open", False)
     next_open = market_clock.get("next_open", "N/A")
     next_close = market_clock.get("next_close", "N/A")
     
-    prompt_parts.append(
+    buf.write(
         f"\nMARKET STATUS\n"
-        f"{'=' * 80}\n"
-        f"Market is currently: {'OPEN' if is_open else 'CLOSED'}"
+        f"{_SEP_EQ}\n"
+        f"Market is currently: {'OPEN' if is_open else 'CLOSED'}\n"
     )
     if not is_open:
-        prompt_parts.append(f"Next open: {next_open}")
+        buf.write(f"Next open: {next_open}\n")
     else:
-        prompt_parts.append(f"Next close: {next_close}")
+        buf.write(f"Next close: {next_close}\n")
     
-    prompt_parts.append("=" * 80)
+    buf.write(f"{_SEP_EQ}\n")
     
     # Individual Stock Data with LIVE fetching
-    prompt_parts.append(
+    buf.write(
         f"\nCURRENT MARKET STATE FOR ALL STOCKS IN PORTFOLIO\n"
-        f"{'=' * 80}"
+        f"{_SEP_EQ}\n"
     )
     
     for position in positions:
@@ -342,120 +424,85 @@ def generate_stock_trading_prompt_with_live_data(
                 limit=60  # 60 days for indicators
             )
             
-            # Calculate indicators
-            # Functions are defined at the bottom of this file
-            
-            # Intraday indicators (on 5-min bars)
-            intraday_closes = [bar['close'] for bar in intraday_bars]
-            intraday_volumes = [bar['volume'] for bar in intraday_bars]
-            
-            ema20_intraday = calculate_ema(intraday_closes, period=20)
-            macd_intraday = calculate_macd(intraday_closes)
-            rsi14_intraday = calculate_rsi(intraday_closes, period=14)
-            
-            # Daily indicators
-            daily_closes = [bar['close'] for bar in daily_bars]
-            daily_highs = [bar['high'] for bar in daily_bars]
-            daily_lows = [bar['low'] for bar in daily_bars]
-            daily_volumes = [bar['volume'] for bar in daily_bars]
-            
-            sma20_daily = sum(daily_closes[-20:]) / 20
-            sma50_daily = sum(daily_closes[-50:]) / 50
-            atr14_daily = calculate_atr(daily_highs, daily_lows, daily_closes, period=14)
-            atr30_daily = calculate_atr(daily_highs, daily_lows, daily_closes, period=30)
-            macd_daily = calculate_macd(daily_closes)
-            rsi14_daily = calculate_rsi(daily_closes, period=14)
-            
-            avg_volume_20d = sum(daily_volumes[-20:]) / 20
-            
-            # Current state
-            current_ema20 = ema20_intraday[-1] if ema20_intraday else current_price
-            current_macd = macd_intraday[-1] if macd_intraday else 0
-            current_rsi14 = rsi14_intraday[-1] if rsi14_intraday else 50
-            
-            prompt_parts.append(
-                f"\nALL {symbol} DATA\n"
-                f"{'-' * 80}\n"
-                f"current_price = {current_price:.2f}, "
-                f"current_ema20 = {current_ema20:.2f}, "
-                f"current_macd = {current_macd:.3f}, "
-                f"current_rsi (14 period) = {current_rsi14:.3f}"
-            )
-            
-            # Volume and volatility
-            current_volume = intraday_volumes[-1] if intraday_volumes else 0
-            prompt_parts.append(
-                f"\nIn addition, here is the latest {symbol} volume and volatility metrics:\n"
-                f"Average Volume (20-day): {avg_volume_20d:,.0f}  "
-                f"Current Volume: {current_volume:,.0f}\n"
-                f"ATR (14-day): {atr14_daily:.2f}  "
-                f"ATR (30-day): {atr30_daily:.2f}"
-            )
-            
-            # Intraday series (last 10 bars)
-            last_10_prices = intraday_closes[-10:]
-            last_10_ema20 = ema20_intraday[-10:] if len(ema20_intraday) >= 10 else ema20_intraday
-            last_10_macd = macd_intraday[-10:] if len(macd_intraday) >= 10 else macd_intraday
-            last_10_rsi = rsi14_intraday[-10:] if len(rsi14_intraday) >= 10 else rsi14_intraday
-            last_10_volumes = intraday_volumes[-10:]
+            # Fetchers return [] when there is no data - nothing to compute
+            if not intraday_bars or not daily_bars:
+                logger.warning(f"No bar data for {symbol}, skipping indicators")
+                buf.write(_NO_DATA_TMPL.format_map({'symbol': symbol, 'sep': _SEP_DASH, 'end': _SEP_EQ}))
+                continue
             
-            prompt_parts.append(
-                "\nIntraday series (15-minute intervals, oldest → latest):\n"
-                f"{symbol} prices: {[round(p, 2) for p in last_10_prices]}\n"
-                f"EMA indicators (20-period): {[round(e, 3) for e in last_10_ema20]}\n"
-                f"MACD indicators: {[round(m, 3) for m in last_10_macd]}\n"
-                f"RSI indicators (14-Period): {[round(r, 3) for r in last_10_rsi]}\n"
-                f"Volume series: {[int(v) for v in last_10_volumes]}"
-            )
+            # All indicators for this symbol in one pass, along with the
+            # price/volume columns they were computed from
+            indicators = compute_symbol_indicators(intraday_bars, daily_bars)
+            intraday_closes = indicators['intraday_closes']
+            intraday_volumes = indicators['intraday_volumes']
+            daily_volumes = indicators['daily_volumes']
+            ema20_intraday = indicators['ema20_intraday']
+            macd_intraday = indicators['macd_intraday']
+            rsi14_intraday = indicators['rsi14_intraday']
+            macd_daily = indicators['macd_daily']
+            rsi14_daily = indicators['rsi14_daily']
             
-            # Longer-term context (daily)
-            last_10_macd_daily = macd_daily[-10:] if len(macd_daily) >= 10 else macd_daily
-            last_10_rsi_daily = rsi14_daily[-10:] if len(rsi14_daily) >= 10 else rsi14_daily
+            # Last _TAIL bars of each series (slicing handles shorter series)
+            last_10_ema20 = ema20_intraday[-_TAIL:]
+            last_10_macd = macd_intraday[-_TAIL:]
+            last_10_rsi = rsi14_intraday[-_TAIL:]
+            last_10_macd_daily = macd_daily[-_TAIL:]
+            last_10_rsi_daily = rsi14_daily[-_TAIL:]
             
-            prompt_parts.append(
-                "\nLonger-term context (daily timeframe):\n"
-                f"20-Day SMA: {sma20_daily:.2f} vs. 50-Day SMA: {sma50_daily:.2f}\n"
-                f"14-Day ATR: {atr14_daily:.2f} vs. 30-Day ATR: {atr30_daily:.2f}\n"
-                f"Current Volume: {daily_volumes[-1]:,.0f} vs. Average Volume (20-day): {avg_volume_20d:,.0f}\n"
-                f"MACD indicators (daily): {[round(m, 3) for m in last_10_macd_daily]}\n"
-                f"RSI indicators (14-Period daily): {[round(r, 3) for r in last_10_rsi_daily]}"
-            )
+            buf.write(_STOCK_SECTION_TMPL.format_map({
+                **indicators,
+                'symbol': symbol,
+                'sep': _SEP_DASH,
+                'current_price': current_price,
+                'current_ema20': ema20_intraday[-1] if ema20_intraday else current_price,
+                'current_macd': macd_intraday[-1] if macd_intraday else 0,
+                'current_rsi14': rsi14_intraday[-1] if rsi14_intraday else 50,
+                'current_volume': intraday_volumes[-1] if intraday_volumes else 0,
+                'daily_volume': daily_volumes[-1],
+                'last_10_prices': [round(p, 2) for p in intraday_closes[-_TAIL:]],
+                'last_10_ema20': [round(e, 3) for e in last_10_ema20],
+                'last_10_macd': [round(m, 3) for m in last_10_macd],
+                'last_10_rsi': [round(r, 3) for r in last_10_rsi],
+                'last_10_volumes': [int(v) for v in intraday_volumes[-_TAIL:]],
+                'last_10_macd_daily': [round(m, 3) for m in last_10_macd_daily],
+                'last_10_rsi_daily': [round(r, 3) for r in last_10_rsi_daily],
+            }))
             
             # Fundamental metrics (if available from fetcher)
             if hasattr(market_data_fetcher, 'get_fundamentals'):
                 fundamentals = market_data_fetcher.get_fundamentals(symbol)
-                prompt_parts.append(
+                buf.write(
                     "\nFundamental metrics:\n"
                     f"Market Cap: ${fundamentals.get('market_cap', 0):,.0f}, "
                     f"P/E Ratio: {fundamentals.get('pe_ratio', 'N/A')}, "
                     f"Dividend Yield: {fundamentals.get('dividend_yield', 0):.2f}%, "
-                    f"Beta: {fundamentals.get('beta', 'N/A')}"
+                    f"Beta: {fundamentals.get('beta', 'N/A')}\n"
                 )
             
-            prompt_parts.append("=" * 80)
+            buf.write(f"{_SEP_EQ}\n")
             
         except Exception as e:
             logger.error(f"Error fetching market data for {symbol}: {e}")
-            prompt_parts.append(
+            buf.write(
                 f"\nALL {symbol} DATA\n"
-                f"{'-' * 80}\n"
+                f"{_SEP_DASH}\n"
                 f"Error fetching market data: {str(e)}\n"
-                f"{'=' * 80}"
+                f"{_SEP_EQ}\n"
             )
     
     # Account Information
-    prompt_parts.append(
+    buf.write(
         f"\nHERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE\n"
-        f"{'=' * 80}\n"
+        f"{_SEP_EQ}\n"
         f"Current Total Return (percent): {total_return_pct:.2f}%\n"
         f"Available Cash: ${cash:,.2f}\n"
         f"Current Account Value: ${portfolio_value:,.2f}\n"
-        f"Total Equity: ${equity:,.2f}"
+        f"Total Equity: ${equity:,.2f}\n"
     )
     
     if positions:
-        prompt_parts.append(
-            "\nCurrent live positions & performance:"
+        buf.write(
+            "\nCurrent live positions & performance:\n"
         )
         for pos in positions:
             position_dict = {
@@ -469,11 +516,11 @@ def generate_stock_trading_prompt_with_live_data(
                 'cost_basis': round(pos.get('cost_basis', 0), 2),
                 'change_today': round(pos.get('change_today', 0), 2)
             }
-            prompt_parts.append(str(position_dict))
+            buf.write(f"{position_dict}\n")
     else:
-        prompt_parts.append("\nNo current positions")
+        buf.write("\nNo current positions\n")
     
-    return "\n".join(prompt_parts)
+    return buf.getvalue()
 
 
 # ==================== Helper Functions for Indicators ====================
@@ -572,3 +619,44 @@ def calculate_atr(
     else:
         return sum(true_ranges) / len(true_ranges)
 
+
+def compute_symbol_indicators(
+    intraday_bars: List[Dict[str, Any]],
+    daily_bars: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Compute every indicator the stock prompt needs for one symbol.
+    
+    A series that is too short for a period yields an empty list.
+    
+    Args:
+        intraday_bars: Intraday bars (dicts with close, volume, ...)
+        daily_bars: Daily bars (dicts with close, high, low, volume, ...)
+        
+    Returns:
+        Dict with intraday EMA/MACD/RSI series, daily MACD/RSI series,
+        daily SMA20/SMA50, ATR14/ATR30, 20-day average volume, and the
+        intraday close/volume and daily volume columns
+    """
+    intraday_closes = [bar['close'] for bar in intraday_bars]
+    intraday_volumes = [bar['volume'] for bar in intraday_bars]
+    daily_closes = [bar['close'] for bar in daily_bars]
+    daily_highs = [bar['high'] for bar in daily_bars]
+    daily_lows = [bar['low'] for bar in daily_bars]
+    daily_volumes = [bar['volume'] for bar in daily_bars]
+    
+    return {
+        'intraday_closes': intraday_closes,
+        'intraday_volumes': intraday_volumes,
+        'daily_volumes': daily_volumes,
+        'ema20_intraday': calculate_ema(intraday_closes, period=20),
+        'macd_intraday': calculate_macd(intraday_closes),
+        'rsi14_intraday': calculate_rsi(intraday_closes, period=14),
+        'macd_daily': calculate_macd(daily_closes),
+        'rsi14_daily': calculate_rsi(daily_closes, period=14),
+        'sma20_daily': sum(daily_closes[-20:]) / 20,
+        'sma50_daily': sum(daily_closes[-50:]) / 50,
+        'atr14_daily': calculate_atr(daily_highs, daily_lows, daily_closes, period=14),
+        'atr30_daily': calculate_atr(daily_highs, daily_lows, daily_closes, period=30),
+        'avg_volume_20d': sum(daily_volumes[-20:]) / 20,
+    }
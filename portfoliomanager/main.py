@@ -9,8 +9,16 @@ import sys
 import os
 import argparse
 import asyncio
+import atexit
 import logging
+import logging.config
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
+import orjson
+
+from .utils.logger import BufferedFileHandler
 
 # Load environment variables
 load_dotenv()
@@ -18,46 +26,113 @@ load_dotenv()
 # Set environment variable to suppress MCP logs in subprocesses
 os.environ.setdefault('MCP_LOG_LEVEL', 'ERROR')
 
-# Setup logging with both console and file output
 from pathlib import Path
-from datetime import datetime
 
-# Create logs directory
+# Logs directory (created when logging is configured)
 LOGS_DIR = Path("./logs")
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
-# Generate log filename with timestamp
-log_filename = LOGS_DIR / f"portfolio_manager_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-# Configure logging - suppress MCP server logs
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(),  # Console output
-        logging.FileHandler(log_filename)  # File output
-    ]
-)
 
-# Suppress verbose MCP server logs (these are very noisy in production)
-# The MCP library logs every tool request at INFO level
-logging.getLogger('mcp').setLevel(logging.ERROR)
-logging.getLogger('mcp.server').setLevel(logging.ERROR)
-logging.getLogger('mcp.client').setLevel(logging.ERROR)
-logging.getLogger('mcp.server.stdio').setLevel(logging.ERROR)
-logging.getLogger('langchain_mcp_adapters').setLevel(logging.WARNING)
 
-# Suppress other verbose loggers
-logging.getLogger('httpx').setLevel(logging.WARNING)
-logging.getLogger('httpcore').setLevel(logging.WARNING)
+def _configure_logging() -> Path:
+    """
+    Set up console and file logging for this run.
+    
+    Called from main() so that importing this module has no side effects
+    (no log directory or timestamped log file is created on import).
+    
+    Returns:
+        Path to this run's log file
+    """
+    # Create logs directory
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Generate log filename with timestamp; the microsecond suffix keeps
+    # back-to-back restarts within the same second from sharing a file
+    now_ns = time.time_ns()
+    log_timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(now_ns // 1_000_000_000))
+    log_filename = LOGS_DIR / f"portfolio_manager_{log_timestamp}_{now_ns // 1_000 % 1_000_000:06d}.log"
+    
+    # Configure logging in one dictConfig call - records are queued on the
+    # calling thread and written to the console/file by a background listener.
+    # dictConfig closes any existing handlers, so the listener's handlers are
+    # created after it.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logging.config.dictConfig({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {
+            'queue': {'()': QueueHandler, 'queue': log_queue},
+        },
+        'root': {'level': 'INFO', 'handlers': ['queue']},
+        'loggers': {
+            # Suppress verbose MCP server logs (these are very noisy in production)
+            # The MCP library logs every tool request at INFO level
+            'mcp': {'level': 'ERROR'},
+            'mcp.server': {'level': 'ERROR'},
+            'mcp.client': {'level': 'ERROR'},
+            'mcp.server.stdio': {'level': 'ERROR'},
+            'langchain_mcp_adapters': {'level': 'WARNING'},
+            # Suppress other verbose loggers
+            'httpx': {'level': 'WARNING'},
+            'httpcore': {'level': 'WARNING'},
+        },
+    })
+    
+    log_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    console_handler = logging.StreamHandler()  # Console output
+    console_handler.setFormatter(log_formatter)
+    file_handler = BufferedFileHandler(log_filename)  # File output (buffered, flushed every 1s)
+    file_handler.setFormatter(log_formatter)
+    
+    log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    log_listener.start()
+    # Flush queued records on normal exit, sys.exit() and KeyboardInterrupt
+    atexit.register(log_listener.stop)
+    
+    return log_filename
+
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Banners are logged as single multi-line records; the leading newline keeps
+# the block aligned under the log line prefix
+_SEP = "=" * 60
+_START_BANNER = (
+    f"\n{_SEP}\n"
+    "🤖 LANGGRAPH PORTFOLIO MANAGER\n"
+    f"{_SEP}\n"
+    "✨ Architecture: Graph-based with MCP tools\n"
+    "🤖 Decision Making: Fully autonomous\n"
+    f"{_SEP}"
+)
+_RESULTS_BANNER = f"\n{_SEP}\n📊 ITERATION RESULTS\n{_SEP}"
+_COMPLETE_BANNER = f"\n{_SEP}\n✅ Iteration complete!\n{_SEP}"
+
 from .config import PORTFOLIO_CONFIG
-from .graph_v2 import run_portfolio_iteration
-from .graph_v2.portfolio_graph import stream_portfolio_iteration
+
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion on a fresh event loop.
+    
+    Uses a scoped asyncio.Runner on Python 3.11+, which closes the loop and
+    shuts down its default executor on exit; older versions fall back to
+    asyncio.run().
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    if not hasattr(asyncio, "Runner"):
+        return asyncio.run(coro)
+    
+    with asyncio.Runner() as runner:
+        return runner.run(coro)
 
 
 def main():
@@ -73,7 +148,7 @@ def main():
     )
     parser.add_argument(
         '--config',
-        type=str,
+        type=argparse.FileType('rb'),
         help='Path to custom config file (optional)'
     )
     parser.add_argument(
@@ -82,18 +157,21 @@ def main():
         help='Enable streaming mode (shows real-time progress)'
     )
     
+    # Opens --config here, so a bad path exits (code 2) before any log file exists
     args = parser.parse_args()
     
+    log_filename = _configure_logging()
+    
     logger.info("Portfolio Manager initialized")
-    logger.info(f"Logging to: {log_filename.absolute()}")
+    logger.info("Logging to: %s", log_filename.absolute())
     
     # Load config
     config = PORTFOLIO_CONFIG.copy()
     if args.config:
-        import json
-        with open(args.config, 'r') as f:
-            custom_config = json.load(f)
-            config.update(custom_config)
+        with args.config as config_file:
+            config_bytes = config_file.read()
+        custom_config = orjson.loads(config_bytes)
+        config.update(custom_config)
     
     # Add log file path to config so it can be uploaded to S3
     config['log_file_path'] = str(log_filename)
@@ -105,19 +183,18 @@ def main():
         logger.info("\n\nShutting down gracefully...")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"\nFatal error: {e}", exc_info=True)
+        logger.error("\nFatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
 def run_portfolio_manager(config, mode, stream=False):
     """Run LangGraph portfolio manager"""
     
-    logger.info("="*60)
-    logger.info("🤖 LANGGRAPH PORTFOLIO MANAGER")
-    logger.info("="*60)
-    logger.info(f"✨ Architecture: Graph-based with MCP tools")
-    logger.info(f"🤖 Decision Making: Fully autonomous")
-    logger.info("="*60)
+    # Skip building banner/result lines entirely when INFO is filtered out
+    info_on = logger.isEnabledFor(logging.INFO)
+    
+    if info_on:
+        logger.info(_START_BANNER)
     
     if mode == 'scheduled':
         logger.warning("⚠️  Scheduled mode not yet implemented")
@@ -126,47 +203,59 @@ def run_portfolio_manager(config, mode, stream=False):
     if stream:
         # Streaming mode
         logger.info("🌊 Streaming mode enabled - showing real-time progress")
-        asyncio.run(stream_portfolio_iteration(config))
+        # Graph imports are deferred so importing this module stays cheap
+        from .graph_v2.portfolio_graph import stream_portfolio_iteration
+        _run_async(stream_portfolio_iteration(config))
     else:
         # Standard mode
         logger.info("Running single iteration...")
+        from .graph_v2 import run_portfolio_iteration
         result = run_portfolio_iteration(config)
+        iteration_id = result['iteration_id']
+        phase = result['phase']
+        error = result.get('error')
+        executed_trades = result.get('executed_trades') or []
         
         # Show results
-        logger.info("="*60)
-        logger.info("📊 ITERATION RESULTS")
-        logger.info("="*60)
-        logger.info(f"✅ Iteration ID: {result['iteration_id']}")
-        logger.info(f"✅ Phase: {result['phase']}")
+        if info_on:
+            logger.info(_RESULTS_BANNER)
+            logger.info("✅ Iteration ID: %s", iteration_id)
+            logger.info("✅ Phase: %s", phase)
         
         # Check if market was closed
-        if result['phase'] == 'market_closed':
+        if phase == 'market_closed':
             logger.warning("🚫 MARKET IS CLOSED")
-            logger.warning(f"⏰ {result.get('error', 'Market is currently closed')}")
+            logger.warning("⏰ %s", error or 'Market is currently closed')
             logger.warning("📌 No trading operations performed")
             logger.warning("🔄 Run again when market is open")
-        elif result.get('error'):
-            logger.error(f"⚠️  Error: {result['error']}")
+        elif error:
+            logger.error("⚠️  Error: %s", error)
         else:
             # Normal execution - show trade results
-            logger.info(f"✅ Trades Executed: {len(result.get('executed_trades', []))}")
+            logger.info("✅ Trades Executed: %d", len(executed_trades))
             
-            if result.get('executed_trades'):
-                logger.info("📋 Executed Trades:")
-                for trade in result['executed_trades']:
-                    status = trade.get('status', 'unknown')
-                    ticker = trade.get('ticker')
-                    action = trade.get('action')
-                    
-                    if status == 'submitted':
-                        logger.info(f"  ✅ {action} {ticker} - Order ID: {trade.get('order_id')}")
-                    else:
-                        logger.error(f"  ❌ {action} {ticker} - Error: {trade.get('error', 'Unknown')}")
+            if executed_trades:
+                # Successes go in one INFO record and failures in their own
+                # ERROR record, so a failure never raises the level of the rest
+                succeeded = [trade for trade in executed_trades if trade.get('status') == 'submitted']
+                failed = [trade for trade in executed_trades if trade.get('status') != 'submitted']
+                if succeeded and info_on:
+                    lines = ["📋 Executed Trades:"]
+                    lines.extend(
+                        f"  ✅ {trade['action']} {trade['ticker']} - Order ID: {trade.get('order_id')}"
+                        for trade in succeeded
+                    )
+                    logger.info("\n".join(lines))
+                if failed:
+                    lines = ["📋 Failed Trades:"]
+                    lines.extend(
+                        f"  ❌ {trade['action']} {trade['ticker']} - Error: {trade.get('error', 'Unknown')}"
+                        for trade in failed
+                    )
+                    logger.error("\n".join(lines))
         
-        logger.info("="*60)
-        logger.info("✅ Iteration complete!")
-        logger.info("="*60)
-
+        if info_on:
+            logger.info(_COMPLETE_BANNER)
 
 if __name__ == "__main__":
     main()
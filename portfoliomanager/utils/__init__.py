@@ -1,8 +1,8 @@
 """Portfolio management utilities"""
 
-from .logger import PortfolioLogger
+from .logger import PortfolioLogger, BufferedFileHandler
 from .scheduler import TradingScheduler
 from .constraints import TradingConstraints
 
-__all__ = ['PortfolioLogger', 'TradingScheduler', 'TradingConstraints']
+__all__ = ['PortfolioLogger', 'BufferedFileHandler', 'TradingScheduler', 'TradingConstraints']
 
@@ -6,9 +6,83 @@ for consistency and transparency.
 """
 
 import os
+import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that buffers writes instead of flushing after every record.
+    
+    Records accumulate in a large write buffer and are flushed by a background
+    thread every `flush_interval` seconds, when the buffer fills, or right away
+    for records at `flush_level` or above so warnings and errors hit the disk
+    immediately.
+    """
+    
+    def __init__(
+        self,
+        filename: Union[str, os.PathLike[str]],
+        mode: str = 'a',
+        encoding: Optional[str] = None,
+        buffer_size: int = 65536,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.WARNING
+    ):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Path to the log file
+            mode: File open mode
+            encoding: File encoding
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Seconds between background flushes
+            flush_level: Records at or above this level are flushed immediately
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(filename, mode=mode, encoding=encoding)
+        
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer"""
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def _flush_periodically(self):
+        """Flush the buffer every flush_interval seconds until closed"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord):
+        """Write a record, flushing only for records at flush_level or above"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        """Stop the flush thread, then flush and close the file"""
+        self._stop_flushing.set()
+        super().close()
 
 
 class PortfolioLogger:
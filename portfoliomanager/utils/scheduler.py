@@ -5,6 +5,7 @@ Schedules portfolio management iterations at specified times during trading days
 """
 
 import time
+import traceback
 from datetime import datetime, time as dt_time, date
 from typing import List, Optional
 try:
@@ -83,15 +84,17 @@ class TradingScheduler:
             return False
         
         # Check if current time matches any scheduled time (within 1 minute)
+        current_dt = datetime.combine(current_date, current_time)
         for scheduled_time in self.schedule_times:
-            # Create datetime objects for comparison
             scheduled_dt = datetime.combine(current_date, scheduled_time)
-            current_dt = datetime.combine(current_date, current_time)
             
             # Check if we're within 1 minute of scheduled time
-            diff = abs((current_dt - scheduled_dt).total_seconds())
-            if diff < 60:  # Within 1 minute
+            diff = (current_dt - scheduled_dt).total_seconds()
+            if abs(diff) < 60:  # Within 1 minute
                 return True
+            # schedule_times is sorted, so every later slot is further ahead
+            if diff <= -60:
+                break
         
         return False
     
@@ -136,7 +139,6 @@ class TradingScheduler:
                         
                     except Exception as e:
                         print(f"Error during scheduled run: {e}")
-                        import traceback
                         traceback.print_exc()
                 
                 # Wait before next check
@@ -167,6 +169,5 @@ class TradingScheduler:
             print(f"\nIteration completed at {now_str}")
         except Exception as e:
             print(f"Error during manual run: {e}")
-            import traceback
             traceback.print_exc()
 
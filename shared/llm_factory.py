@@ -27,6 +27,8 @@ Usage:
 """
 
 import os
+import threading
+from functools import lru_cache
 from typing import Optional, Any
 from langchain_core.language_models import BaseChatModel
 
@@ -34,6 +36,10 @@ from langchain_core.language_models import BaseChatModel
 from shared.langsmith_config import configure_langsmith_ssl
 configure_langsmith_ssl()
 
+# Connection pool shared by every OpenAI-compatible client (created lazily)
+_http_client: Any = None
+_http_client_lock = threading.Lock()
+
 
 def get_llm(
     model_name: Optional[str] = None,
@@ -143,6 +149,28 @@ def _detect_provider(model_name: str) -> str:
     return "openai"
 
 
+def _get_shared_http_client() -> Any:
+    """
+    Get the process-wide httpx client used by OpenAI-compatible LLMs.
+    
+    Each ChatOpenAI otherwise opens its own connection pool, so every new
+    instance (one per node per iteration) pays a fresh TCP + TLS handshake.
+    Sharing one keep-alive pool lets later calls reuse warm connections.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx
+                # An injected client replaces openai's own (600s timeout),
+                # so the request timeout has to be set here
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    timeout=httpx.Timeout(60.0)
+                )
+    return _http_client
+
+
 def _create_openai_llm(
     model_name: str,
     temperature: float,
@@ -170,6 +198,9 @@ def _create_openai_llm(
     if base_url:
         llm_kwargs["base_url"] = base_url
     
+    # Reuse warm connections unless the caller brought its own client
+    llm_kwargs.setdefault("http_client", _get_shared_http_client())
+    
     return ChatOpenAI(**llm_kwargs)
 
 
@@ -238,6 +269,24 @@ def _create_google_llm(
 
 # ==================== Config-Based Helpers ====================
 
+@lru_cache(maxsize=8)
+def _get_cached_llm(
+    model_name: str,
+    temperature: float,
+    provider: Optional[str],
+    base_url: Optional[str]
+) -> BaseChatModel:
+    """
+    Get a shared LLM instance for a (model, temperature, provider, base_url) key.
+    
+    The config helpers below run once per graph node per iteration with the
+    same settings, so the chat model is built once and reused. Chat models
+    hold no per-call state (bind_tools returns a new runnable), so sharing an
+    instance is safe. Construction errors are not cached.
+    """
+    return get_llm(model_name, temperature=temperature, provider=provider, base_url=base_url)
+
+
 def get_llm_from_config(
     config: dict,
     model_key: str = "deep_think_llm",
@@ -273,12 +322,7 @@ def get_llm_from_config(
     # Get base URL from config
     base_url = config.get("backend_url")
     
-    return get_llm(
-        model_name=model_name,
-        temperature=temperature,
-        provider=provider,
-        base_url=base_url
-    )
+    return _get_cached_llm(model_name, temperature, provider, base_url)
 
 
 def get_quick_llm(config: dict) -> BaseChatModel:
@@ -311,7 +355,7 @@ def get_quick_llm(config: dict) -> BaseChatModel:
         None
     )
     
-    return get_llm(model, temperature=0, provider=provider, base_url=base_url)
+    return _get_cached_llm(model, 0, provider, base_url)
 
 
 def get_deep_llm(config: dict) -> BaseChatModel:
@@ -344,7 +388,7 @@ def get_deep_llm(config: dict) -> BaseChatModel:
         None
     )
     
-    return get_llm(model, temperature=0, provider=provider, base_url=base_url)
+    return _get_cached_llm(model, 0, provider, base_url)
 
 
 def get_agent_llm(config: dict) -> BaseChatModel:
@@ -376,5 +420,5 @@ def get_agent_llm(config: dict) -> BaseChatModel:
         None
     )
     
-    return get_llm(model, temperature=0, provider=provider, base_url=base_url)
+    return _get_cached_llm(model, 0, provider, base_url)
 